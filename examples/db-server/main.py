@@ -12,9 +12,16 @@ The database-server cursor rules automatically apply when working in a servers/d
 """
 
 import asyncio
+import copy
+import hashlib
 import logging
+import os
 import re
-from typing import Dict, Any, List, Optional
+import sys
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Dict, Any, List, Optional, AsyncIterator, Tuple
 import aiosqlite
 from dataclasses import dataclass
 from pathlib import Path
@@ -29,6 +36,29 @@ logger = logging.getLogger(__name__)
 # Configuration
 DATABASE_PATH = Path("./data/example.db")
 MAX_QUERY_RESULTS = 1000
+READER_POOL_SIZE = os.cpu_count() or 4
+SCHEMA_CACHE_MAX_ENTRIES = 256
+QUERY_CACHE_MAX_ENTRIES = 1024
+QUERY_CACHE_TTL_SECONDS = 30.0
+QUERY_CACHE_MAX_BYTES = 64 * 1024 * 1024  # Approximate memory budget for cached results
+QUERY_CACHE_SIZE_SAMPLE = 16  # Rows sampled when estimating a result's size
+MAX_CONCURRENT_QUERIES = 16  # Backpressure: further tool calls queue instead of piling up
+COUNT_BATCH_SIZE = 500  # SQLite's default limit on UNION ALL terms per statement
+
+# Server-tuned SQLite settings applied once per connection
+SQLITE_PRAGMAS = """
+    PRAGMA journal_mode = WAL;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA cache_size = -20000;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA busy_timeout = 5000;
+    PRAGMA foreign_keys = ON;
+"""
+
+# Precompiled validation patterns
+_COMMENT_RE = re.compile(r';\s*--')
+_DANGEROUS_KEYWORDS = ("drop", "delete", "update", "insert", "alter", "create", "truncate")
+_DANGEROUS_KEYWORD_RE = re.compile(r'\b(?:' + '|'.join(_DANGEROUS_KEYWORDS) + r')\b')
 
 
 @dataclass
@@ -41,9 +71,19 @@ class DatabaseOperation:
 
 # SQL Security Validation (enforced by database-server cursor rules)
 
+def _is_identifier(name: str) -> bool:
+    """
+    Check for a plain SQL identifier ([A-Za-z_][A-Za-z0-9_]*).
+    
+    For ASCII input str.isidentifier() accepts exactly that grammar and runs
+    in C, avoiding the regex engine on every tool call.
+    """
+    return name.isascii() and name.isidentifier()
+
+
 def validate_table_name(table_name: str) -> bool:
     """Validate table name to prevent SQL injection"""
-    if not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', table_name):
+    if not _is_identifier(table_name):
         raise ValueError(f"Invalid table name: {table_name}")
     return True
 
@@ -53,9 +93,9 @@ def validate_column_names(columns: str) -> bool:
     if columns == "*":
         return True
     
-    column_list = [col.strip() for col in columns.split(',')]
-    for col in column_list:
-        if not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', col):
+    for col in columns.split(','):
+        col = col.strip()
+        if not _is_identifier(col):
             raise ValueError(f"Invalid column name: {col}")
     return True
 
@@ -63,19 +103,27 @@ def validate_column_names(columns: str) -> bool:
 def validate_where_clause(where_clause: str) -> bool:
     """Basic validation for WHERE clause (simplified for demo)"""
     # In production, use parameterized queries instead
-    dangerous_patterns = [
-        r';\s*--',  # SQL injection comments
-        r'\bDROP\b', r'\bDELETE\b', r'\bUPDATE\b', r'\bINSERT\b',
-        r'\bALTER\b', r'\bCREATE\b', r'\bTRUNCATE\b'
-    ]
+    # Too short to hold ";--" or any keyword
+    if len(where_clause) < 3:
+        return True
+    
+    if "--" in where_clause and _COMMENT_RE.search(where_clause):
+        raise ValueError(f"Potentially dangerous SQL pattern detected")
     
-    for pattern in dangerous_patterns:
-        if re.search(pattern, where_clause, re.IGNORECASE):
-            raise ValueError(f"Potentially dangerous SQL pattern detected")
+    # Fast path: plain substring scans clear most clauses; only a hit pays for
+    # the word-boundary regex (so e.g. "created_at" is still allowed)
+    lower = where_clause.lower()
+    if any(kw in lower for kw in _DANGEROUS_KEYWORDS) and _DANGEROUS_KEYWORD_RE.search(lower):
+        raise ValueError(f"Potentially dangerous SQL pattern detected")
     
     return True
 
 
+def _quote_identifier(name: str) -> str:
+    """Escape an identifier from sqlite_master for use inside double quotes"""
+    return name.replace('"', '""')
+
+
 # Database Connection Management
 
 class DatabaseConnection:
@@ -86,14 +134,16 @@ class DatabaseConnection:
         self.connection: Optional[aiosqlite.Connection] = None
     
     async def connect(self) -> None:
-        """Establish database connection"""
+        """Establish database connection and apply server-tuned PRAGMAs"""
         try:
-            self.connection = await aiosqlite.connect(self.db_path)
-            await self.connection.execute("PRAGMA foreign_keys = ON")
-            await self.connection.commit()
-            logger.info(f"Connected to database: {self.db_path}")
+            # Autocommit mode so the PRAGMAs don't open an implicit transaction
+            self.connection = await aiosqlite.connect(self.db_path, isolation_level=None)
+            await self.connection.executescript(SQLITE_PRAGMAS)
+            # Rows carry their column names, so results convert straight to dicts
+            self.connection.row_factory = aiosqlite.Row
+            logger.info("Connected to database: %s", self.db_path)
         except Exception as e:
-            logger.error(f"Database connection error: {e}")
+            logger.error("Database connection error: %s", e)
             raise
     
     async def disconnect(self) -> None:
@@ -104,12 +154,317 @@ class DatabaseConnection:
             logger.info("Database connection closed")
 
 
+# Connection Pooling
+
+class ConnectionPool:
+    """
+    One writer and N reader connections sharing a WAL-mode database.
+    
+    WAL lets readers run concurrently with each other and with the single
+    writer, so read-only tools never wait on a fresh connection.
+    """
+    
+    def __init__(self, db_path: Path, reader_count: int = READER_POOL_SIZE):
+        self.db_path = db_path
+        self.reader_count = reader_count
+        self._writer: Optional[DatabaseConnection] = None
+        self._writer_lock = asyncio.Lock()
+        self._readers: List[DatabaseConnection] = []
+        self._idle_readers: "asyncio.Queue[aiosqlite.Connection]" = asyncio.Queue()
+        # Caps in-flight database work across all tools (bound to this pool's loop)
+        self.query_slots = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
+    
+    async def _open_connection(self) -> DatabaseConnection:
+        """Open a pooled connection"""
+        db_conn = DatabaseConnection(self.db_path)
+        await db_conn.connect()
+        return db_conn
+    
+    async def open(self) -> None:
+        """Open the writer first (switching the database to WAL), then the readers"""
+        self._writer = await self._open_connection()
+        for _ in range(self.reader_count):
+            reader = await self._open_connection()
+            self._readers.append(reader)
+            self._idle_readers.put_nowait(reader.connection)
+        logger.info("Connection pool opened: 1 writer, %d readers", self.reader_count)
+    
+    async def close(self) -> None:
+        """Close every pooled connection"""
+        for reader in self._readers:
+            await reader.disconnect()
+        self._readers.clear()
+        self._idle_readers = asyncio.Queue()
+        if self._writer:
+            await self._writer.disconnect()
+            self._writer = None
+    
+    @asynccontextmanager
+    async def acquire_reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a reader connection, waiting if all readers are busy"""
+        try:
+            conn = self._idle_readers.get_nowait()
+        except asyncio.QueueEmpty:
+            conn = await self._idle_readers.get()
+        try:
+            yield conn
+        finally:
+            self._idle_readers.put_nowait(conn)
+    
+    @asynccontextmanager
+    async def acquire_writer(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow the single writer connection exclusively"""
+        async with self._writer_lock:
+            yield self._writer.connection
+
+
+# Shared pool reused across tool calls (avoids per-call connect overhead).
+# The lock is created lazily so it belongs to the event loop that opens the pool.
+_pool: Optional[ConnectionPool] = None
+_pool_lock: Optional[asyncio.Lock] = None
+
+
+async def get_pool() -> ConnectionPool:
+    """
+    Return the shared connection pool, opening it lazily on first use.
+    
+    Each pooled connection runs on its own non-daemon aiosqlite thread, so
+    once the pool is open the caller must await shutdown() before the event
+    loop finishes, or the interpreter will hang at exit.
+    """
+    global _pool, _pool_lock
+    if _pool_lock is None:
+        _pool_lock = asyncio.Lock()
+    async with _pool_lock:
+        if _pool is None:
+            pool = ConnectionPool(DATABASE_PATH)
+            await pool.open()
+            _pool = pool
+    return _pool
+
+
+async def shutdown() -> None:
+    """
+    Close the shared connection pool for clean process exit.
+    
+    Must be awaited whenever get_pool() (or any tool called without conn=) has
+    been used: the pool's aiosqlite worker threads are non-daemon and keep the
+    process alive until their connections are closed.
+    """
+    global _pool, _pool_lock
+    if _pool_lock is None:
+        return
+    async with _pool_lock:
+        if _pool is not None:
+            await _pool.close()
+            _pool = None
+    _pool_lock = None
+
+
+@asynccontextmanager
+async def _query_slot(conn: Optional[aiosqlite.Connection]) -> AsyncIterator[None]:
+    """Hold one of the pool's query slots; callers with their own connection skip it"""
+    if conn is not None:
+        yield
+        return
+    pool = await get_pool()
+    async with pool.query_slots:
+        yield
+
+
+@asynccontextmanager
+async def _reader(conn: Optional[aiosqlite.Connection]) -> AsyncIterator[aiosqlite.Connection]:
+    """Yield the caller's connection if given, otherwise borrow a pooled reader"""
+    if conn is not None:
+        yield conn
+        return
+    pool = await get_pool()
+    async with pool.acquire_reader() as reader:
+        yield reader
+
+
+@asynccontextmanager
+async def _writer(conn: Optional[aiosqlite.Connection]) -> AsyncIterator[aiosqlite.Connection]:
+    """Yield the caller's connection if given, otherwise borrow the pooled writer"""
+    if conn is not None:
+        yield conn
+        return
+    pool = await get_pool()
+    async with pool.acquire_writer() as writer:
+        yield writer
+
+
+# Result Caching
+# Schema, stats and query results only change on writes, so they are cached
+# until a write path calls invalidate_cache(). Query results also expire after
+# QUERY_CACHE_TTL_SECONDS. Entries are stored and returned as copies so a
+# caller mutating a response can't corrupt the cache.
+
+_schema_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_stats_cache: Optional[Dict[str, Any]] = None
+_stats_cache_generation = -1
+_cache_generation = 0
+
+# Query cache entries: key -> (expires_at, approximate size in bytes, data)
+_query_cache: "OrderedDict[bytes, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+_query_cache_bytes = 0
+
+
+def clear_cache() -> None:
+    """Drop every cached query result"""
+    global _query_cache_bytes
+    _query_cache.clear()
+    _query_cache_bytes = 0
+
+
+def invalidate_cache(table: Optional[str] = None) -> None:
+    """
+    Invalidate cached results after a write.
+    
+    Any tool that modifies the database must call this with the affected
+    table (or None to drop every cached schema).
+    """
+    global _cache_generation
+    if table is None:
+        _schema_cache.clear()
+    else:
+        _schema_cache.pop(table, None)
+    # WHERE clauses may reference other tables, so all query results go
+    clear_cache()
+    _cache_generation += 1
+
+
+def _cache_schema(table: str, data: Dict[str, Any]) -> None:
+    """Store a copy of a schema result, evicting the least recently used entry when full"""
+    _schema_cache[table] = copy.deepcopy(data)
+    _schema_cache.move_to_end(table)
+    if len(_schema_cache) > SCHEMA_CACHE_MAX_ENTRIES:
+        _schema_cache.popitem(last=False)
+
+
+def _query_cache_key(query: str, params: Tuple[Any, ...]) -> bytes:
+    """Hash the rendered SQL and its bound parameters into a compact cache key"""
+    return hashlib.blake2b(repr((query, params)).encode(), digest_size=16).digest()
+
+
+def _estimate_result_size(results: List[Dict[str, Any]]) -> int:
+    """
+    Roughly estimate the memory held by a list of result rows.
+    
+    Sizes up to QUERY_CACHE_SIZE_SAMPLE evenly spaced rows and extrapolates,
+    so storing a large result doesn't cost a full walk over every value.
+    """
+    size = sys.getsizeof(results)
+    if not results:
+        return size
+    step = max(1, len(results) // QUERY_CACHE_SIZE_SAMPLE)
+    sample = results[::step]
+    sample_size = sum(
+        sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row.values())
+        for row in sample
+    )
+    return size + sample_size * len(results) // len(sample)
+
+
+def _get_cached_query(key: bytes) -> Optional[Dict[str, Any]]:
+    """Return a live cached query result, dropping it if it has expired"""
+    global _query_cache_bytes
+    entry = _query_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, size, data = entry
+    if expires_at <= time.monotonic():
+        del _query_cache[key]
+        _query_cache_bytes -= size
+        return None
+    _query_cache.move_to_end(key)
+    return data
+
+
+def _copy_query_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a query result's containers for the cache.
+    
+    Row values from SQLite are immutable scalars, so copying each row dict is
+    enough; a deepcopy would cost more than re-running the query.
+    """
+    return {
+        **data,
+        "results": [dict(row) for row in data["results"]],
+        "columns": list(data["columns"])
+    }
+
+
+def _cache_query(key: bytes, data: Dict[str, Any]) -> None:
+    """Store a copy of a query result, evicting least recently used entries over budget"""
+    global _query_cache_bytes
+    size = _estimate_result_size(data["results"])
+    if size > QUERY_CACHE_MAX_BYTES:
+        return
+    
+    previous = _query_cache.pop(key, None)
+    if previous is not None:
+        _query_cache_bytes -= previous[1]
+    _query_cache[key] = (time.monotonic() + QUERY_CACHE_TTL_SECONDS, size, _copy_query_data(data))
+    _query_cache_bytes += size
+    
+    while (len(_query_cache) > QUERY_CACHE_MAX_ENTRIES
+           or _query_cache_bytes > QUERY_CACHE_MAX_BYTES):
+        _, (_, evicted_size, _) = _query_cache.popitem(last=False)
+        _query_cache_bytes -= evicted_size
+
+
+async def _read_analyze_row_counts(conn: aiosqlite.Connection) -> Dict[str, int]:
+    """
+    Read per-table row estimates from sqlite_stat1 (populated by ANALYZE).
+    
+    The first integer of each stat entry is the row count; the largest value
+    per table is used so partial indexes don't undercount.
+    """
+    try:
+        async with conn.execute("SELECT tbl, stat FROM sqlite_stat1") as cursor:
+            stat_rows = await cursor.fetchall()
+    except aiosqlite.OperationalError:
+        # ANALYZE has never run, so there are no estimates
+        return {}
+    
+    counts: Dict[str, int] = {}
+    for tbl, stat in stat_rows:
+        try:
+            row_count = int(stat.split(maxsplit=1)[0])
+        except (AttributeError, IndexError, ValueError):
+            continue
+        counts[tbl] = max(row_count, counts.get(tbl, 0))
+    return counts
+
+
+async def _count_rows(
+    table_names: List[str], conn: Optional[aiosqlite.Connection] = None
+) -> Dict[str, int]:
+    """Count rows exactly for a batch of tables with one UNION ALL statement"""
+    count_query = " UNION ALL ".join(
+        f'SELECT ? AS name, COUNT(*) AS row_count FROM "{_quote_identifier(name)}"'
+        for name in table_names
+    )
+    async with _reader(conn) as reader:
+        async with reader.execute(count_query, table_names) as cursor:
+            count_rows = await cursor.fetchall()
+    return {row[0]: row[1] for row in count_rows}
+
+
 # MCP Tool Implementation Following Incremental Development
 
-async def query_database_tool(request: Dict[str, Any]) -> Dict[str, Any]:
+async def query_database_tool(
+    request: Dict[str, Any], conn: Optional[aiosqlite.Connection] = None
+) -> Dict[str, Any]:
     """
     Handle database queries with comprehensive security validation.
     
+    Runs on a pooled reader unless the caller passes its own connection (for
+    example a plain aiosqlite.connect() or DatabaseConnection.connection), in
+    which case the result cache is bypassed. Rows are always read as
+    aiosqlite.Row, so the connection's own row_factory doesn't matter.
+    
     Development progression (incremental approach):
     1. ✅ Basic query execution (minimal implementation)
     2. ✅ Table name validation (security)
@@ -118,6 +473,7 @@ async def query_database_tool(request: Dict[str, Any]) -> Dict[str, Any]:
     5. ✅ Result limiting (performance)
     6. ✅ Error handling (reliability)
     7. ✅ Logging (debugging)
+    8. ✅ Result caching (performance)
     
     This follows the incremental development approach enforced by cursor rules.
     """
@@ -131,7 +487,7 @@ async def query_database_tool(request: Dict[str, Any]) -> Dict[str, Any]:
         where_clause = request.get("where", "")
         limit = request.get("limit", 100)
         
-        logger.info(f"Processing database query: table={table}, columns={columns}")
+        logger.info("Processing database query: table=%s, columns=%s", table, columns)
         
         # Security: Validate table name
         validate_table_name(table)
@@ -146,57 +502,72 @@ async def query_database_tool(request: Dict[str, Any]) -> Dict[str, Any]:
         # Performance: Enforce result limits
         if limit > MAX_QUERY_RESULTS:
             limit = MAX_QUERY_RESULTS
-            logger.warning(f"Query limit reduced to maximum: {MAX_QUERY_RESULTS}")
+            logger.warning("Query limit reduced to maximum: %d", MAX_QUERY_RESULTS)
         
         # Build and execute query
         query = f"SELECT {columns} FROM {table}"
         if where_clause:
             query += f" WHERE {where_clause}"
-        query += f" LIMIT {limit}"
+        query += " LIMIT ?"
+        params = (limit,)
         
-        # Execute query with proper connection management
-        db_conn = DatabaseConnection(DATABASE_PATH)
-        await db_conn.connect()
+        # Performance: Serve repeated queries from the result cache
+        use_cache = conn is None
+        cache_key = _query_cache_key(query, params)
+        cached = _get_cached_query(cache_key) if use_cache else None
+        if cached is not None:
+            logger.debug("Query served from cache: %d rows", cached["count"])
+            return {"status": "success", "data": _copy_query_data(cached)}
+        generation = _cache_generation
         
-        try:
-            async with db_conn.connection.execute(query) as cursor:
-                rows = await cursor.fetchall()
-                column_names = [desc[0] for desc in cursor.description]
+        async with _query_slot(conn):
+            # Execute query (LIMIT is bound so the prepared statement is reused
+            # across different limits)
+            async with _reader(conn) as reader:
+                async with reader.execute(query, params) as cursor:
+                    # Set per cursor so caller-supplied connections work whatever
+                    # their row_factory
+                    cursor.row_factory = aiosqlite.Row
+                    rows = await cursor.fetchall()
+                    column_names = [desc[0] for desc in cursor.description]
             
             # Format results
-            results = []
-            for row in rows:
-                results.append(dict(zip(column_names, row)))
-            
-            logger.info(f"Query executed successfully: {len(results)} rows returned")
-            return {
-                "status": "success",
-                "data": {
-                    "query": query,
-                    "results": results,
-                    "count": len(results),
-                    "columns": column_names
-                }
-            }
-            
-        finally:
-            await db_conn.disconnect()
+            results = [dict(row) for row in rows]
+        
+        data = {
+            "query": query,
+            "limit": limit,
+            "results": results,
+            "count": len(results),
+            "columns": column_names
+        }
+        # Skip caching if a write invalidated the cache while the query ran
+        if use_cache and generation == _cache_generation:
+            _cache_query(cache_key, data)
+        
+        logger.info("Query executed successfully: %d rows returned", len(results))
+        return {"status": "success", "data": data}
         
     except ValueError as e:
-        logger.error(f"Validation error: {e}")
+        logger.error("Validation error: %s", e)
         return {"status": "error", "error": str(e)}
     except aiosqlite.Error as e:
-        logger.error(f"Database error: {e}")
+        logger.error("Database error: %s", e)
         return {"status": "error", "error": f"Database error: {str(e)}"}
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
         return {"status": "error", "error": "Internal server error"}
 
 
-async def get_table_schema_tool(request: Dict[str, Any]) -> Dict[str, Any]:
+async def get_table_schema_tool(
+    request: Dict[str, Any], conn: Optional[aiosqlite.Connection] = None
+) -> Dict[str, Any]:
     """
     Get table schema information with security validation.
     
+    Runs on a pooled reader unless the caller passes its own connection, in
+    which case the schema cache is bypassed.
+    
     Incremental development progression:
     1. ✅ Basic schema retrieval
     2. ✅ Table name validation
@@ -209,63 +580,73 @@ async def get_table_schema_tool(request: Dict[str, Any]) -> Dict[str, Any]:
         if not table:
             raise ValueError("table parameter is required")
         
-        logger.info(f"Processing schema request for table: {table}")
+        logger.info("Processing schema request for table: %s", table)
         
         # Security: Validate table name
         validate_table_name(table)
         
-        # Execute schema query
-        db_conn = DatabaseConnection(DATABASE_PATH)
-        await db_conn.connect()
+        # Performance: Serve repeat lookups from the schema cache
+        use_cache = conn is None
+        cached = _schema_cache.get(table) if use_cache else None
+        if cached is not None:
+            _schema_cache.move_to_end(table)
+            logger.debug("Schema served from cache for table: %s", table)
+            return {"status": "success", "data": copy.deepcopy(cached)}
+        generation = _cache_generation
         
-        try:
-            # Get table schema using PRAGMA
-            schema_query = f"PRAGMA table_info({table})"
-            async with db_conn.connection.execute(schema_query) as cursor:
-                schema_rows = await cursor.fetchall()
-            
-            if not schema_rows:
-                raise ValueError(f"Table '{table}' not found")
-            
-            # Format schema information
-            columns = []
-            for row in schema_rows:
-                columns.append({
-                    "name": row[1],
-                    "type": row[2],
-                    "not_null": bool(row[3]),
-                    "default_value": row[4],
-                    "primary_key": bool(row[5])
-                })
-            
-            logger.info(f"Schema retrieved successfully for table: {table}")
-            return {
-                "status": "success",
-                "data": {
-                    "table": table,
-                    "columns": columns,
-                    "column_count": len(columns)
-                }
-            }
-            
-        finally:
-            await db_conn.disconnect()
+        # Get table schema using PRAGMA
+        schema_query = f"PRAGMA table_info({table})"
+        async with _query_slot(conn):
+            async with _reader(conn) as reader:
+                async with reader.execute(schema_query) as cursor:
+                    schema_rows = await cursor.fetchall()
+        
+        if not schema_rows:
+            raise ValueError(f"Table '{table}' not found")
+        
+        # Format schema information
+        columns = []
+        for row in schema_rows:
+            columns.append({
+                "name": row[1],
+                "type": row[2],
+                "not_null": bool(row[3]),
+                "default_value": row[4],
+                "primary_key": bool(row[5])
+            })
+        
+        data = {
+            "table": table,
+            "columns": columns,
+            "column_count": len(columns)
+        }
+        # Skip caching if a write invalidated the cache while the PRAGMA ran
+        if use_cache and generation == _cache_generation:
+            _cache_schema(table, data)
+        
+        logger.info("Schema retrieved successfully for table: %s", table)
+        return {"status": "success", "data": data}
         
     except ValueError as e:
-        logger.error(f"Validation error: {e}")
+        logger.error("Validation error: %s", e)
         return {"status": "error", "error": str(e)}
     except aiosqlite.Error as e:
-        logger.error(f"Database error: {e}")
+        logger.error("Database error: %s", e)
         return {"status": "error", "error": f"Database error: {str(e)}"}
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
         return {"status": "error", "error": "Internal server error"}
 
 
-async def get_database_stats_tool(request: Dict[str, Any]) -> Dict[str, Any]:
+async def get_database_stats_tool(
+    request: Dict[str, Any], conn: Optional[aiosqlite.Connection] = None
+) -> Dict[str, Any]:
     """
     Get database statistics.
     
+    Runs on the reader pool unless the caller passes its own connection, in
+    which case the stats cache is bypassed and counts run on that connection.
+    
     Incremental development progression:
     1. ✅ Basic statistics retrieval
     2. ✅ Table enumeration
@@ -274,63 +655,82 @@ async def get_database_stats_tool(request: Dict[str, Any]) -> Dict[str, Any]:
     5. ✅ Logging
     """
     try:
+        global _stats_cache, _stats_cache_generation
         logger.info("Processing database statistics request")
         
-        db_conn = DatabaseConnection(DATABASE_PATH)
-        await db_conn.connect()
+        # Performance: Serve from cache unless a write happened since
+        use_cache = conn is None
+        if use_cache and _stats_cache is not None and _stats_cache_generation == _cache_generation:
+            logger.debug("Database statistics served from cache")
+            return {"status": "success", "data": copy.deepcopy(_stats_cache)}
+        generation = _cache_generation
         
-        try:
-            # Get all tables
-            tables_query = "SELECT name FROM sqlite_master WHERE type='table'"
-            async with db_conn.connection.execute(tables_query) as cursor:
-                table_rows = await cursor.fetchall()
-            
-            table_stats = []
-            for table_row in table_rows:
-                table_name = table_row[0]
+        async with _query_slot(conn):
+            async with _reader(conn) as reader:
+                # Get all user tables (skips SQLite internals such as sqlite_stat1)
+                tables_query = (
+                    "SELECT name FROM sqlite_master "
+                    "WHERE type='table' AND name NOT LIKE 'sqlite\\_%' ESCAPE '\\'"
+                )
+                async with reader.execute(tables_query) as cursor:
+                    table_rows = await cursor.fetchall()
                 
-                # Get row count for each table
-                count_query = f"SELECT COUNT(*) FROM {table_name}"
-                async with db_conn.connection.execute(count_query) as cursor:
-                    count_result = await cursor.fetchone()
-                    row_count = count_result[0] if count_result else 0
+                table_names = [row[0] for row in table_rows]
                 
-                table_stats.append({
-                    "table": table_name,
-                    "row_count": row_count
-                })
-            
-            logger.info(f"Database statistics retrieved: {len(table_stats)} tables")
-            return {
-                "status": "success",
-                "data": {
-                    "total_tables": len(table_stats),
-                    "tables": table_stats
-                }
-            }
+                # Performance: Use ANALYZE row estimates where available (O(1) read)
+                estimated_counts = await _read_analyze_row_counts(reader)
             
-        finally:
-            await db_conn.disconnect()
+            # Fall back to exact counts, spreading UNION ALL batches across the
+            # reader pool so they run in parallel under WAL (a caller-supplied
+            # connection gets a single sequence of batches)
+            exact_tables = [name for name in table_names if name not in estimated_counts]
+            parallelism = 1 if conn is not None else (await get_pool()).reader_count
+            batch_size = max(1, min(COUNT_BATCH_SIZE, -(-len(exact_tables) // parallelism)))
+            batches = [
+                exact_tables[start:start + batch_size]
+                for start in range(0, len(exact_tables), batch_size)
+            ]
+            exact_counts: Dict[str, int] = {}
+            for counts in await asyncio.gather(*(_count_rows(batch, conn) for batch in batches)):
+                exact_counts.update(counts)
+        
+        table_stats = []
+        for name in table_names:
+            approximate = name in estimated_counts
+            table_stats.append({
+                "table": name,
+                "row_count": estimated_counts[name] if approximate else exact_counts[name],
+                "approximate": approximate
+            })
+        
+        data = {
+            "total_tables": len(table_stats),
+            "tables": table_stats,
+            "note": "Counts marked approximate come from ANALYZE statistics and may lag recent writes"
+        }
+        if use_cache:
+            _stats_cache = copy.deepcopy(data)
+            _stats_cache_generation = generation
+        
+        logger.info("Database statistics retrieved: %d tables", len(table_stats))
+        return {"status": "success", "data": data}
         
     except aiosqlite.Error as e:
-        logger.error(f"Database error: {e}")
+        logger.error("Database error: %s", e)
         return {"status": "error", "error": f"Database error: {str(e)}"}
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
         return {"status": "error", "error": "Internal server error"}
 
 
 # Database initialization for demo
-async def initialize_demo_database():
+async def initialize_demo_database(conn: Optional[aiosqlite.Connection] = None):
     """Initialize demo database with sample data"""
     DATABASE_PATH.parent.mkdir(parents=True, exist_ok=True)
     
-    db_conn = DatabaseConnection(DATABASE_PATH)
-    await db_conn.connect()
-    
-    try:
+    async with _writer(conn) as writer:
         # Create sample table
-        await db_conn.connection.execute("""
+        await writer.execute("""
             CREATE TABLE IF NOT EXISTS users (
                 id INTEGER PRIMARY KEY,
                 name TEXT NOT NULL,
@@ -339,19 +739,27 @@ async def initialize_demo_database():
             )
         """)
         
-        # Insert sample data
-        await db_conn.connection.execute("""
-            INSERT OR IGNORE INTO users (id, name, email) VALUES 
-            (1, 'Alice Johnson', 'alice@example.com'),
-            (2, 'Bob Smith', 'bob@example.com'),
-            (3, 'Charlie Brown', 'charlie@example.com')
-        """)
+        # Insert sample data with one prepared statement in a single transaction
+        await writer.execute("BEGIN")
+        try:
+            await writer.executemany(
+                "INSERT OR IGNORE INTO users (id, name, email) VALUES (?, ?, ?)",
+                [
+                    (1, 'Alice Johnson', 'alice@example.com'),
+                    (2, 'Bob Smith', 'bob@example.com'),
+                    (3, 'Charlie Brown', 'charlie@example.com')
+                ]
+            )
+            await writer.commit()
+        except Exception:
+            await writer.rollback()
+            raise
         
-        await db_conn.connection.commit()
-        logger.info("Demo database initialized")
+        # Refresh row estimates used by get_database_stats_tool
+        await writer.execute("ANALYZE")
         
-    finally:
-        await db_conn.disconnect()
+        invalidate_cache("users")
+        logger.info("Demo database initialized")
 
 
 # Example usage demonstrating the incremental development approach
@@ -366,37 +774,65 @@ async def main():
     4. Add comprehensive logging
     """
     
-    # Initialize demo database
-    await initialize_demo_database()
-    
-    # Example 1: Query database
-    print("=== Example 1: Querying database ===")
-    query_result = await query_database_tool({
-        "table": "users",
-        "columns": "id, name, email",
-        "limit": 10
-    })
-    print(f"Query result: {query_result}")
-    
-    # Example 2: Get table schema
-    print("\n=== Example 2: Getting table schema ===")
-    schema_result = await get_table_schema_tool({
-        "table": "users"
-    })
-    print(f"Schema result: {schema_result}")
-    
-    # Example 3: Get database statistics
-    print("\n=== Example 3: Getting database statistics ===")
-    stats_result = await get_database_stats_tool({})
-    print(f"Stats result: {stats_result}")
-    
-    # Example 4: Error handling demonstration
-    print("\n=== Example 4: Error handling ===")
-    error_result = await query_database_tool({
-        "table": "nonexistent_table"
-    })
-    print(f"Error result: {error_result}")
-
+    try:
+        # Initialize demo database
+        await initialize_demo_database()
+        
+        # Example 1: Query database
+        print("=== Example 1: Querying database ===")
+        query_result = await query_database_tool({
+            "table": "users",
+            "columns": "id, name, email",
+            "limit": 10
+        })
+        print(f"Query result: {query_result}")
+        
+        # Example 2: Get table schema
+        print("\n=== Example 2: Getting table schema ===")
+        schema_result = await get_table_schema_tool({
+            "table": "users"
+        })
+        print(f"Schema result: {schema_result}")
+        
+        # Example 3: Get database statistics
+        print("\n=== Example 3: Getting database statistics ===")
+        stats_result = await get_database_stats_tool({})
+        print(f"Stats result: {stats_result}")
+        
+        # Example 4: Error handling demonstration
+        print("\n=== Example 4: Error handling ===")
+        error_result = await query_database_tool({
+            "table": "nonexistent_table"
+        })
+        print(f"Error result: {error_result}")
+        
+        # Example 5: Running several calls on one caller-supplied connection
+        print("\n=== Example 5: Using a caller-supplied connection ===")
+        db_conn = DatabaseConnection(DATABASE_PATH)
+        await db_conn.connect()
+        try:
+            conn_query_result = await query_database_tool({
+                "table": "users",
+                "columns": "id, name",
+                "limit": 2
+            }, conn=db_conn.connection)
+            print(f"Query result: {conn_query_result}")
+            
+            conn_stats_result = await get_database_stats_tool({}, conn=db_conn.connection)
+            print(f"Stats result: {conn_stats_result}")
+        finally:
+            await db_conn.disconnect()
+    
+    finally:
+        # Close the shared connection pool
+        await shutdown()
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    # Prefer uvloop's libuv-based event loop when it is installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(main()) 
\ No newline at end of file
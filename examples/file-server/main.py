@@ -12,12 +12,12 @@ The file-server cursor rules automatically apply when working in a servers/file-
 """
 
 import asyncio
+import functools
 import logging
+import os
 import re
 from pathlib import Path
 from typing import Dict, Any, List
-import aiofiles
-import aiofiles.os
 from dataclasses import dataclass
 
 # Setup logging (enforced by cursor rules)
@@ -30,7 +30,11 @@ logger = logging.getLogger(__name__)
 # Configuration
 BASE_DIR = Path("./data/files")
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
-ALLOWED_EXTENSIONS = {".txt", ".json", ".csv", ".md", ".py"}
+MAX_CONCURRENT_READS = 16  # Bounds open file descriptors in batch reads
+ALLOWED_EXTENSIONS = frozenset({".txt", ".json", ".csv", ".md", ".py"})
+
+# Resolved once at import so path validation doesn't stat the base directory per call
+_BASE_RESOLVED = BASE_DIR.resolve()
 
 
 @dataclass
@@ -41,6 +45,18 @@ class FileOperation:
     error: str = ""
 
 
+@functools.lru_cache(maxsize=1024)
+def _resolve(file_path: str, base_resolved: Path) -> Path:
+    """Map a requested path into the resolved base directory (memoized per input)"""
+    resolved_path = base_resolved / Path(file_path).name
+    
+    # Check if path is within base directory
+    if not resolved_path.is_relative_to(base_resolved):
+        raise ValueError("Invalid file path: directory traversal detected")
+    
+    return resolved_path
+
+
 def validate_file_path(file_path: str, base_dir: Path = BASE_DIR) -> Path:
     """
     Validate file path to prevent directory traversal attacks.
@@ -49,33 +65,39 @@ def validate_file_path(file_path: str, base_dir: Path = BASE_DIR) -> Path:
     """
     try:
         # Resolve path and ensure it's within base directory
-        resolved_path = base_dir.resolve() / Path(file_path).name
-        
-        # Check if path is within base directory
-        if not str(resolved_path).startswith(str(base_dir.resolve())):
-            raise ValueError("Invalid file path: directory traversal detected")
-        
-        return resolved_path
+        base_resolved = _BASE_RESOLVED if base_dir is BASE_DIR else base_dir.resolve()
+        return _resolve(file_path, base_resolved)
     except Exception as e:
-        logger.error(f"Path validation error: {e}")
+        logger.error("Path validation error: %s", e)
         raise ValueError(f"Invalid file path: {e}")
 
 
 def validate_file_extension(file_path: Path) -> bool:
     """Validate file extension against allowed types"""
-    return file_path.suffix.lower() in ALLOWED_EXTENSIONS
+    suffix = file_path.suffix
+    # Common lowercase case hits on the first lookup without allocating
+    return suffix in ALLOWED_EXTENSIONS or suffix.lower() in ALLOWED_EXTENSIONS
 
 
-async def check_file_size(file_path: Path) -> None:
-    """Check file size before processing"""
+async def check_file_size(file_path: Path) -> int:
+    """Check file size before processing and return it (single stat call)"""
     try:
-        if file_path.exists():
-            file_size = await aiofiles.os.path.getsize(file_path)
-            if file_size > MAX_FILE_SIZE:
-                raise ValueError(f"File too large: {file_size} bytes (max: {MAX_FILE_SIZE})")
+        file_size = (await asyncio.to_thread(os.stat, file_path)).st_size
     except Exception as e:
-        logger.error(f"File size check error: {e}")
+        # Missing files are reported by the caller, so only log other failures
+        if not isinstance(e, FileNotFoundError):
+            logger.error("File size check error: %s", e)
         raise
+    
+    if file_size > MAX_FILE_SIZE:
+        raise ValueError(f"File too large: {file_size} bytes (max: {MAX_FILE_SIZE})")
+    return file_size
+
+
+def _read_bytes_limited(file_path: Path) -> bytes:
+    """Read at most MAX_FILE_SIZE + 1 bytes, so growth after the size check is detectable"""
+    with open(file_path, "rb") as f:
+        return f.read(MAX_FILE_SIZE + 1)
 
 
 # MCP Tool Implementation Following Incremental Development
@@ -101,7 +123,7 @@ async def read_file_tool(request: Dict[str, Any]) -> Dict[str, Any]:
             raise ValueError("file_path is required")
         
         encoding = request.get("encoding", "utf-8")
-        logger.info(f"Processing file read request: {file_path}")
+        logger.info("Processing file read request: %s", file_path)
         
         # Security: Validate file path
         safe_path = validate_file_path(file_path)
@@ -113,17 +135,20 @@ async def read_file_tool(request: Dict[str, Any]) -> Dict[str, Any]:
         # Performance: Check file size
         await check_file_size(safe_path)
         
-        # Read file asynchronously
-        async with aiofiles.open(safe_path, 'r', encoding=encoding) as f:
-            content = await f.read()
+        # Read file in one thread-offloaded call, then decode once. The read is
+        # bounded and re-checked in case the file grew after the size check.
+        raw = await asyncio.to_thread(_read_bytes_limited, safe_path)
+        if len(raw) > MAX_FILE_SIZE:
+            raise ValueError(f"File too large: more than {MAX_FILE_SIZE} bytes")
+        content = raw.decode(encoding)
         
-        logger.info(f"Successfully read file: {safe_path}")
+        logger.info("Successfully read file: %s", safe_path)
         return {
             "status": "success",
             "data": {
                 "content": content,
                 "path": str(safe_path),
-                "size": len(content),
+                "size": len(raw),
                 "encoding": encoding
             }
         }
@@ -137,10 +162,57 @@ async def read_file_tool(request: Dict[str, Any]) -> Dict[str, Any]:
         logger.error(error_msg)
         return {"status": "error", "error": error_msg}
     except ValueError as e:
-        logger.error(f"Validation error: {e}")
+        logger.error("Validation error: %s", e)
         return {"status": "error", "error": str(e)}
     except Exception as e:
-        logger.error(f"Unexpected error reading file: {e}")
+        logger.error("Unexpected error reading file: %s", e)
+        return {"status": "error", "error": "Internal server error"}
+
+
+async def read_files_tool(request: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Handle batch file read requests, reading files concurrently.
+    
+    Incremental development progression:
+    1. ✅ Batch reading via read_file_tool (same per-file validation)
+    2. ✅ Bounded concurrency (performance)
+    3. ✅ Per-file error reporting
+    4. ✅ Logging
+    """
+    try:
+        # Input validation
+        file_paths = request.get("file_paths")
+        if not file_paths or not isinstance(file_paths, list):
+            raise ValueError("file_paths must be a non-empty list")
+        
+        encoding = request.get("encoding", "utf-8")
+        logger.info("Processing batch file read request: %d files", len(file_paths))
+        
+        # Performance: Read concurrently, capped to bound open file descriptors
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_READS)
+        
+        async def read_one(file_path: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await read_file_tool({"file_path": file_path, "encoding": encoding})
+        
+        results = await asyncio.gather(*(read_one(path) for path in file_paths))
+        
+        error_count = sum(1 for result in results if result["status"] != "success")
+        logger.info("Batch read completed: %d files, %d errors", len(results), error_count)
+        return {
+            "status": "success",
+            "data": {
+                "files": results,
+                "count": len(results),
+                "error_count": error_count
+            }
+        }
+        
+    except ValueError as e:
+        logger.error("Validation error: %s", e)
+        return {"status": "error", "error": str(e)}
+    except Exception as e:
+        logger.error("Unexpected error reading files: %s", e)
         return {"status": "error", "error": "Internal server error"}
 
 
@@ -167,7 +239,7 @@ async def write_file_tool(request: Dict[str, Any]) -> Dict[str, Any]:
             raise ValueError("content is required")
         
         encoding = request.get("encoding", "utf-8")
-        logger.info(f"Processing file write request: {file_path}")
+        logger.info("Processing file write request: %s", file_path)
         
         # Security: Validate file path
         safe_path = validate_file_path(file_path)
@@ -176,19 +248,19 @@ async def write_file_tool(request: Dict[str, Any]) -> Dict[str, Any]:
         if not validate_file_extension(safe_path):
             raise ValueError(f"File type not allowed: {safe_path.suffix}")
         
-        # Performance: Check content size
-        content_size = len(content.encode(encoding))
+        # Performance: Encode once and check the encoded size
+        data = content.encode(encoding)
+        content_size = len(data)
         if content_size > MAX_FILE_SIZE:
             raise ValueError(f"Content too large: {content_size} bytes")
         
         # Create directory if needed
         safe_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Write file asynchronously
-        async with aiofiles.open(safe_path, 'w', encoding=encoding) as f:
-            await f.write(content)
+        # Write the already-encoded bytes in one thread-offloaded call
+        await asyncio.to_thread(safe_path.write_bytes, data)
         
-        logger.info(f"Successfully wrote file: {safe_path}")
+        logger.info("Successfully wrote file: %s", safe_path)
         return {
             "status": "success",
             "data": {
@@ -199,14 +271,14 @@ async def write_file_tool(request: Dict[str, Any]) -> Dict[str, Any]:
         }
         
     except ValueError as e:
-        logger.error(f"Validation error: {e}")
+        logger.error("Validation error: %s", e)
         return {"status": "error", "error": str(e)}
     except PermissionError:
         error_msg = f"Permission denied: {file_path}"
         logger.error(error_msg)
         return {"status": "error", "error": error_msg}
     except Exception as e:
-        logger.error(f"Unexpected error writing file: {e}")
+        logger.error("Unexpected error writing file: %s", e)
         return {"status": "error", "error": "Internal server error"}
 
 
@@ -246,7 +318,21 @@ async def main():
         "file_path": "nonexistent.txt"
     })
     print(f"Error result: {error_result}")
+    
+    # Example 4: Batch read (missing files are reported per file)
+    print("\n=== Example 4: Reading multiple files ===")
+    batch_result = await read_files_tool({
+        "file_paths": ["example.txt", "nonexistent.txt"]
+    })
+    print(f"Batch read result: {batch_result}")
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    # Prefer uvloop's libuv-based event loop when it is installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(main()) 
\ No newline at end of file